@@ -293,6 +293,8 @@ class BaseFunctionToolSchema(Generic[BaseFunctionSchemaT]):
 
 
 class AnthropicStreamParser(StreamParser[MessageStreamEvent]):
+    __slots__ = ()
+
     def is_content(self, item: MessageStreamEvent) -> bool:
         return item.type == "content_block_delta"
 
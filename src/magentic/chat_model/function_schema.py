@@ -3,7 +3,7 @@ import typing
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable, Callable, Iterable
 from functools import singledispatch
-from typing import Any, Generic, TypeVar, cast, get_args, get_origin
+from typing import Any, ClassVar, Generic, TypeVar, cast, get_args, get_origin
 
 from openai.types.shared_params import FunctionDefinition
 from pydantic import BaseModel, TypeAdapter, create_model
@@ -29,6 +29,11 @@ T = TypeVar("T")
 class BaseFunctionSchema(ABC, Generic[T]):
     """Converts a Python object to the JSON Schema that represents it as a function for the LLM."""
 
+    # Whether parse_args/aparse_args returns a lazy iterable that consumes the
+    # chunks only when iterated. Class-level so it can be checked without an
+    # isinstance call against the schema instance.
+    returns_iterable: ClassVar[bool] = False
+
     # Allow any arguments to avoid error passing type to subclasses without __init__
     def __init__(self, *args: Any, **kwargs: Any): ...
 
@@ -202,6 +207,8 @@ IterableT = TypeVar("IterableT", bound=Iterable[Any])
 class IterableFunctionSchema(FunctionSchema[IterableT], Generic[IterableT]):
     """FunctionSchema for types that are iterable. Can parse LLM output as a stream."""
 
+    returns_iterable: ClassVar[bool] = True
+
     def __init__(self, output_type: type[IterableT]):
         self._output_type = output_type
         self._item_type_adapter: TypeAdapter[Any] = TypeAdapter(
@@ -245,6 +252,8 @@ class AsyncIterableFunctionSchema(
 ):
     """FunctionSchema for types that are async iterable. Can parse LLM output as a stream."""
 
+    returns_iterable: ClassVar[bool] = True
+
     def __init__(self, output_type: type[AsyncIterableT]):
         self._output_type = output_type
         item_type: type | Any = args[0] if (args := get_args(output_type)) else Any
@@ -36,6 +36,8 @@ except ImportError as error:
 
 
 class LitellmStreamParser(StreamParser[ModelResponse]):
+    __slots__ = ()
+
     def is_content(self, item: ModelResponse) -> bool:
         assert isinstance(item.choices[0], StreamingChoices)
         return bool(item.choices[0].delta.content)
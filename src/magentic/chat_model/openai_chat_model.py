@@ -295,6 +295,8 @@ class BaseFunctionToolSchema(Generic[BaseFunctionSchemaT]):
 
 
 class OpenaiStreamParser(StreamParser[ChatCompletionChunk]):
+    __slots__ = ()
+
     def is_content(self, item: ChatCompletionChunk) -> bool:
         return bool(item.choices and item.choices[0].delta.content)
 
@@ -339,8 +341,9 @@ class OpenaiStreamState(StreamState[ChatCompletionChunk]):
     def update(self, item: ChatCompletionChunk) -> None:
         # Add tool call index for Mistral tool calls to make compatible with OpenAI
         # TODO: Remove this fix when MistralChatModel switched to mistral python package
-        if item.choices:
-            for tool_call_chunk in item.choices[0].delta.tool_calls or []:
+        # Guarded so content-only chunks, the common case, skip the loop setup
+        if item.choices and (tool_calls := item.choices[0].delta.tool_calls):
+            for tool_call_chunk in tool_calls:
                 if (
                     tool_call_chunk.id is not None
                     and tool_call_chunk.id not in self._seen_tool_call_ids
@@ -1,24 +1,24 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
 from itertools import chain
-from typing import Any, Generic, NamedTuple, TypeVar
+from operator import attrgetter
+from typing import Any, Generic, TypeVar, cast
 
 from pydantic import ValidationError
 
 from magentic.chat_model.base import ToolSchemaParseError, UnknownToolError
-from magentic.chat_model.function_schema import (
-    AsyncFunctionSchema,
-    FunctionSchema,
-    select_function_schema,
-)
+from magentic.chat_model.function_schema import AsyncFunctionSchema, FunctionSchema
 from magentic.chat_model.message import Message, Usage
 from magentic.streaming import (
+    AsyncPushbackIterator,
     AsyncStreamedStr,
+    PushbackIterator,
     StreamedStr,
-    aapply,
-    achain,
+    abuffered,
     aconsume,
-    apply,
     async_iter,
     consume,
 )
@@ -26,14 +26,29 @@ from magentic.streaming import (
 ItemT = TypeVar("ItemT")
 OutputT = TypeVar("OutputT")
 
+# Maximum time content chunks are held back when batching, to bound latency
+_BATCH_INTERVAL_SECONDS = 0.1
+
+# Number of items to prefetch from the source of an AsyncOutputStream so that
+# network reads overlap with parsing of items already received
+_STREAM_BUFFER_SIZE = 8
+
+# Fetches both attributes in a single C call per tool call chunk
+_get_id_args = attrgetter("id", "args")
+
 
-class FunctionCallChunk(NamedTuple):
+# Use slots for direct attribute reads and smaller instances since one of
+# these is created per tool call delta in the stream
+@dataclass(frozen=True, slots=True)
+class FunctionCallChunk:
     id: str | None
     name: str | None
     args: str | None
 
 
 class StreamParser(ABC, Generic[ItemT]):
+    __slots__ = ()
+
     @abstractmethod
     def is_content(self, item: ItemT) -> bool: ...
 
@@ -65,7 +80,62 @@ class StreamState(ABC, Generic[ItemT]):
     def current_message_snapshot(self) -> Message[Any]: ...
 
 
-class OutputStream(Generic[ItemT, OutputT]):
+FunctionSchemaT = TypeVar("FunctionSchemaT", bound=AsyncFunctionSchema[Any])
+
+
+class _BaseOutputStream(Generic[ItemT, FunctionSchemaT]):
+    """State and per-tool-call logic shared by OutputStream and AsyncOutputStream.
+
+    The per-chunk loops are intentionally kept in the subclasses so the hot
+    path stays free of sync/async dispatch indirection.
+    """
+
+    def __init__(
+        self,
+        function_schemas: Iterable[FunctionSchemaT],
+        parser: StreamParser[ItemT],
+        state: StreamState[ItemT],
+        batch_chars: int | None = None,
+    ):
+        # Index schemas by name once for O(1) lookup per tool call
+        self._function_schema_by_name: dict[str, FunctionSchemaT] = {
+            schema.name: schema for schema in function_schemas
+        }
+        self._parser = parser
+        self._state = state
+        self._batch_chars = batch_chars
+        # Memoize the last name-to-schema lookup since repeated tool calls
+        # usually target the same tool
+        self._last_schema_name: str | None = None
+        self._last_schema: FunctionSchemaT | None = None
+        self._exhausted: bool = False
+
+    def _select_function_schema(
+        self, tool_name: str, tool_call_id: str
+    ) -> FunctionSchemaT:
+        """Resolve the schema for a tool call, raising if the tool is unknown."""
+        if tool_name == self._last_schema_name:
+            function_schema = self._last_schema
+        else:
+            function_schema = self._function_schema_by_name.get(tool_name)
+            self._last_schema_name = tool_name
+            self._last_schema = function_schema
+        if function_schema is None:
+            raise UnknownToolError(
+                output_message=self._state.current_message_snapshot,
+                tool_call_id=tool_call_id,
+                tool_name=tool_name,
+            )
+        return function_schema
+
+    @property
+    def usage_ref(self) -> list[Usage]:
+        return self._state.usage_ref
+
+
+class OutputStream(
+    _BaseOutputStream[ItemT, FunctionSchema[OutputT]], Generic[ItemT, OutputT]
+):
     """Converts streamed LLM output into a stream of magentic objects."""
 
     def __init__(
@@ -74,121 +144,164 @@ class OutputStream(Generic[ItemT, OutputT]):
         function_schemas: Iterable[FunctionSchema[OutputT]],
         parser: StreamParser[ItemT],
         state: StreamState[ItemT],
+        batch_chars: int | None = None,
     ):
+        super().__init__(function_schemas, parser, state, batch_chars)
         self._stream = stream
-        self._function_schemas = function_schemas
-        self._parser = parser
-        self._state = state
-
         self._iterator = self.__stream__()
-        self._exhausted: bool = False
 
     def __next__(self) -> StreamedStr | OutputT:
         return self._iterator.__next__()
 
     def __iter__(self) -> Iterator[StreamedStr | OutputT]:
-        yield from self._iterator
+        # Return the generator directly to avoid a delegating frame per item
+        return self._iterator
 
     def _streamed_str(
         self, stream: Iterator[ItemT], current_item_ref: list[ItemT]
     ) -> Iterator[str]:
+        # Bind method lookups to locals to avoid repeating them for every item
+        get_content = self._parser.get_content
+        is_tool_call = self._parser.is_tool_call
+        batch_chars = self._batch_chars
+        if batch_chars is None:
+            for item in stream:
+                if content := get_content(item):
+                    yield content
+                if is_tool_call(item):
+                    # TODO: Check if output types allow for early return and raise if not
+                    assert not current_item_ref
+                    current_item_ref.append(item)
+                    return
+            self._exhausted = True
+            return
+        # Coalesce adjacent content chunks so downstream consumers see fewer,
+        # larger yields. Flush on a time cap so latency stays bounded.
+        buffer: list[str] = []
+        buffer_len = 0
+        last_yield = time.monotonic()
         for item in stream:
-            if content := self._parser.get_content(item):
-                yield content
-            if self._parser.is_tool_call(item):
+            if content := get_content(item):
+                buffer.append(content)
+                buffer_len += len(content)
+            if is_tool_call(item):
                 # TODO: Check if output types allow for early return and raise if not
+                if buffer:
+                    yield "".join(buffer)
                 assert not current_item_ref
                 current_item_ref.append(item)
                 return
+            if buffer and (
+                buffer_len >= batch_chars
+                or time.monotonic() - last_yield >= _BATCH_INTERVAL_SECONDS
+            ):
+                yield "".join(buffer)
+                buffer.clear()
+                buffer_len = 0
+                last_yield = time.monotonic()
+        if buffer:
+            yield "".join(buffer)
         self._exhausted = True
 
     def _tool_call(
         self,
-        stream: Iterator[FunctionCallChunk],
-        current_tool_call_ref: list[FunctionCallChunk],
+        first_chunk: FunctionCallChunk,
+        stream: PushbackIterator[FunctionCallChunk],
         current_tool_call_id: str,
     ) -> Iterator[str]:
+        # The group head is passed explicitly rather than pushed back so the
+        # pushback buffer only ever holds the boundary chunk of the next group
+        if first_args := first_chunk.args:
+            yield first_args
         for item in stream:
             # Only end the stream if we encounter a new tool call
             # so that the whole stream is consumed including stop_reason/usage chunks
-            if item.id and item.id != current_tool_call_id:
+            item_id, args = _get_id_args(item)
+            if item_id and item_id != current_tool_call_id:
                 # TODO: Check if output types allow for early return and raise if not
-                assert not current_tool_call_ref
-                current_tool_call_ref.append(item)
+                assert not stream.has_pushed
+                stream.push(item)
                 return
-            if item.args:
-                yield item.args
+            if args:
+                yield args
         self._exhausted = True
 
     def __stream__(self) -> Iterator[StreamedStr | OutputT]:
         # This works similarly to `itertools.groupby`
-        stream = apply(self._state.update, self._stream)
+        stream = PushbackIterator(self._stream, self._state.update)
+        is_content = self._parser.is_content
+        is_tool_call = self._parser.is_tool_call
+        iter_tool_calls = self._parser.iter_tool_calls
         current_item_ref = [next(stream)]
         while current_item_ref:
             current_item = current_item_ref.pop()
-            if self._parser.is_content(current_item):
-                stream = chain([current_item], stream)
+            if is_content(current_item):
+                stream.push(current_item)
                 streamed_str = StreamedStr(self._streamed_str(stream, current_item_ref))
                 yield streamed_str
                 if not current_item_ref and not self._exhausted:
                     # Finish the group to allow advancing to the next one
-                    # Consume stream via StreamedStr so it can cache
-                    consume(streamed_str)
-            elif self._parser.is_tool_call(current_item):
-                tool_calls_stream: Iterator[FunctionCallChunk] = (
-                    tool_call_chunk
-                    for item in chain([current_item], stream)
-                    for tool_call_chunk in self._parser.iter_tool_calls(item)
+                    # Drain the cached chunks directly so they are still cached
+                    # for later reads, without re-entering StreamedStr.__iter__
+                    consume(streamed_str._chunks)
+            elif is_tool_call(current_item):
+                stream.push(current_item)
+                # chain.from_iterable flattens the tool call chunks in C,
+                # avoiding a generator frame per chunk
+                tool_calls_stream: PushbackIterator[FunctionCallChunk] = (
+                    PushbackIterator(chain.from_iterable(map(iter_tool_calls, stream)))
+                )
+                current_tool_call_chunk: FunctionCallChunk | None = next(
+                    tool_calls_stream
                 )
-                tool_call_ref = [next(tool_calls_stream)]
-                while tool_call_ref:
-                    current_tool_call_chunk = tool_call_ref.pop()
+                while current_tool_call_chunk is not None:
                     current_tool_call_id = current_tool_call_chunk.id
+                    tool_name = current_tool_call_chunk.name
                     assert current_tool_call_id is not None
-                    assert current_tool_call_chunk.name is not None
-                    function_schema = select_function_schema(
-                        self._function_schemas, current_tool_call_chunk.name
+                    assert tool_name is not None
+                    function_schema = self._select_function_schema(
+                        tool_name, current_tool_call_id
                     )
-                    if function_schema is None:
-                        assert current_tool_call_id is not None
-                        raise UnknownToolError(
-                            output_message=self._state.current_message_snapshot,
-                            tool_call_id=current_tool_call_id,
-                            tool_name=current_tool_call_chunk.name,
-                        )
                     try:
-                        tool_calls_stream = chain(
-                            [current_tool_call_chunk], tool_calls_stream
-                        )
-                        output = function_schema.parse_args(
-                            self._tool_call(
-                                tool_calls_stream, tool_call_ref, current_tool_call_id
+                        if function_schema.returns_iterable:
+                            output = function_schema.parse_args(
+                                self._tool_call(
+                                    current_tool_call_chunk,
+                                    tool_calls_stream,
+                                    current_tool_call_id,
+                                )
                             )
-                        )
-                        yield output
-                        if not tool_call_ref and not self._exhausted:
-                            # Finish the group to allow advancing to the next one
-                            # Output must be Iterable if parse_args above did not consume
-                            assert isinstance(output, Iterable), output
-                            # Consume stream via the output type so it can cache
-                            consume(output)
-
+                            yield output
+                            if not tool_calls_stream.has_pushed and not self._exhausted:
+                                # Finish the group to allow advancing to the next one
+                                # Consume stream via the output type so it can cache
+                                consume(cast("Iterable[Any]", output))
+                        else:
+                            # Single-shot schemas just join the args chunks, so
+                            # pre-join here and hand the schema a single string
+                            # instead of many small fragments
+                            args_json = "".join(
+                                self._tool_call(
+                                    current_tool_call_chunk,
+                                    tool_calls_stream,
+                                    current_tool_call_id,
+                                )
+                            )
+                            yield function_schema.parse_args((args_json,))
                     except ValidationError as e:
-                        assert current_tool_call_id is not None
                         raise ToolSchemaParseError(
                             output_message=self._state.current_message_snapshot,
                             tool_call_id=current_tool_call_id,
                             validation_error=e,
                         ) from e
+                    current_tool_call_chunk = next(tool_calls_stream, None)
             elif new_current_item := next(stream, None):
                 current_item_ref.append(new_current_item)
 
-    @property
-    def usage_ref(self) -> list[Usage]:
-        return self._state.usage_ref
-
 
-class AsyncOutputStream(Generic[ItemT, OutputT]):
+class AsyncOutputStream(
+    _BaseOutputStream[ItemT, AsyncFunctionSchema[OutputT]], Generic[ItemT, OutputT]
+):
     """Async version of `OutputStream`."""
 
     def __init__(
@@ -197,114 +310,165 @@ class AsyncOutputStream(Generic[ItemT, OutputT]):
         function_schemas: Iterable[AsyncFunctionSchema[OutputT]],
         parser: StreamParser[ItemT],
         state: StreamState[ItemT],
+        batch_chars: int | None = None,
     ):
+        super().__init__(function_schemas, parser, state, batch_chars)
         self._stream = stream
-        self._function_schemas = function_schemas
-        self._parser = parser
-        self._state = state
-
         self._iterator = self.__stream__()
-        self._exhausted: bool = False
 
     async def __anext__(self) -> AsyncStreamedStr | OutputT:
         return await self._iterator.__anext__()
 
-    async def __aiter__(self) -> AsyncIterator[AsyncStreamedStr | OutputT]:
-        async for item in self._iterator:
-            yield item
+    def __aiter__(self) -> AsyncIterator[AsyncStreamedStr | OutputT]:
+        # Return the generator directly to avoid a delegating frame per item
+        return self._iterator
 
     async def _streamed_str(
         self, stream: AsyncIterator[ItemT], current_item_ref: list[ItemT]
     ) -> AsyncIterator[str]:
+        # Bind method lookups to locals to avoid repeating them for every item
+        get_content = self._parser.get_content
+        is_tool_call = self._parser.is_tool_call
+        batch_chars = self._batch_chars
+        if batch_chars is None:
+            async for item in stream:
+                if content := get_content(item):
+                    yield content
+                if is_tool_call(item):
+                    # TODO: Check if output types allow for early return
+                    assert not current_item_ref
+                    current_item_ref.append(item)
+                    return
+            self._exhausted = True
+            return
+        # Coalesce adjacent content chunks so downstream consumers see fewer,
+        # larger yields. Flush on a time cap so latency stays bounded.
+        loop_time = asyncio.get_running_loop().time
+        buffer: list[str] = []
+        buffer_len = 0
+        last_yield = loop_time()
         async for item in stream:
-            if content := self._parser.get_content(item):
-                yield content
-            if self._parser.is_tool_call(item):
+            if content := get_content(item):
+                buffer.append(content)
+                buffer_len += len(content)
+            if is_tool_call(item):
                 # TODO: Check if output types allow for early return
+                if buffer:
+                    yield "".join(buffer)
                 assert not current_item_ref
                 current_item_ref.append(item)
                 return
+            if buffer and (
+                buffer_len >= batch_chars
+                or loop_time() - last_yield >= _BATCH_INTERVAL_SECONDS
+            ):
+                yield "".join(buffer)
+                buffer.clear()
+                buffer_len = 0
+                last_yield = loop_time()
+        if buffer:
+            yield "".join(buffer)
         self._exhausted = True
 
     async def _tool_call(
         self,
-        stream: AsyncIterator[FunctionCallChunk],
-        current_tool_call_ref: list[FunctionCallChunk],
+        first_chunk: FunctionCallChunk,
+        stream: AsyncPushbackIterator[FunctionCallChunk],
         current_tool_call_id: str,
     ) -> AsyncIterator[str]:
+        # The group head is passed explicitly rather than pushed back so the
+        # pushback buffer only ever holds the boundary chunk of the next group
+        if first_args := first_chunk.args:
+            yield first_args
         async for item in stream:
-            if item.id and item.id != current_tool_call_id:
+            item_id, args = _get_id_args(item)
+            if item_id and item_id != current_tool_call_id:
                 # TODO: Check if output types allow for early return
-                assert not current_tool_call_ref
-                current_tool_call_ref.append(item)
+                assert not stream.has_pushed
+                stream.push(item)
                 return
-            if item.args:
-                yield item.args
+            if args:
+                yield args
         self._exhausted = True
 
     async def __stream__(self) -> AsyncIterator[AsyncStreamedStr | OutputT]:
-        stream = aapply(self._state.update, self._stream)
+        stream = AsyncPushbackIterator(
+            abuffered(self._stream, maxsize=_STREAM_BUFFER_SIZE), self._state.update
+        )
+        is_content = self._parser.is_content
+        is_tool_call = self._parser.is_tool_call
+        iter_tool_calls = self._parser.iter_tool_calls
         current_item_ref = [await anext(stream)]
         while current_item_ref:
             current_item = current_item_ref.pop()
-            if self._parser.is_content(current_item):
-                stream = achain(async_iter([current_item]), stream)
+            if is_content(current_item):
+                stream.push(current_item)
                 streamed_str = AsyncStreamedStr(
                     self._streamed_str(stream, current_item_ref)
                 )
                 yield streamed_str
                 if not current_item_ref and not self._exhausted:
                     # Finish the group to allow advancing to the next one
-                    # Consume stream via AsyncStreamedStr so it can cache
-                    await aconsume(streamed_str)
-            elif self._parser.is_tool_call(current_item):
-                tool_calls_stream: AsyncIterator[FunctionCallChunk] = (
-                    tool_call_chunk
-                    async for item in achain(async_iter([current_item]), stream)
-                    for tool_call_chunk in self._parser.iter_tool_calls(item)
+                    # Drain the cached chunks directly so they are still cached
+                    # for later reads, without re-entering AsyncStreamedStr.__aiter__
+                    await aconsume(streamed_str._chunks)
+            elif is_tool_call(current_item):
+                stream.push(current_item)
+                tool_calls_stream: AsyncPushbackIterator[FunctionCallChunk] = (
+                    AsyncPushbackIterator(
+                        tool_call_chunk
+                        async for item in stream
+                        for tool_call_chunk in iter_tool_calls(item)
+                    )
                 )
-                tool_call_ref = [await anext(tool_calls_stream)]
-                while tool_call_ref:
-                    current_tool_call_chunk = tool_call_ref.pop()
+                current_tool_call_chunk: FunctionCallChunk | None = await anext(
+                    tool_calls_stream
+                )
+                while current_tool_call_chunk is not None:
                     current_tool_call_id = current_tool_call_chunk.id
+                    tool_name = current_tool_call_chunk.name
                     assert current_tool_call_id is not None
-                    assert current_tool_call_chunk.name is not None
-                    function_schema = select_function_schema(
-                        self._function_schemas, current_tool_call_chunk.name
+                    assert tool_name is not None
+                    function_schema = self._select_function_schema(
+                        tool_name, current_tool_call_id
                     )
-                    if function_schema is None:
-                        assert current_tool_call_id is not None
-                        raise UnknownToolError(
-                            output_message=self._state.current_message_snapshot,
-                            tool_call_id=current_tool_call_id,
-                            tool_name=current_tool_call_chunk.name,
-                        )
                     try:
-                        tool_calls_stream = achain(
-                            async_iter([current_tool_call_chunk]), tool_calls_stream
-                        )
-                        output = await function_schema.aparse_args(
-                            self._tool_call(
-                                tool_calls_stream, tool_call_ref, current_tool_call_id
+                        if function_schema.returns_iterable:
+                            output = await function_schema.aparse_args(
+                                self._tool_call(
+                                    current_tool_call_chunk,
+                                    tool_calls_stream,
+                                    current_tool_call_id,
+                                )
+                            )
+                            yield output
+                            if not tool_calls_stream.has_pushed and not self._exhausted:
+                                # Finish the group to allow advancing to the next one
+                                # Consume stream via the output type so it can cache
+                                await aconsume(cast("AsyncIterable[Any]", output))
+                        else:
+                            # Single-shot schemas just join the args chunks, so
+                            # pre-join here and hand the schema a single string
+                            # instead of many small fragments
+                            args_json = "".join(
+                                [
+                                    chunk
+                                    async for chunk in self._tool_call(
+                                        current_tool_call_chunk,
+                                        tool_calls_stream,
+                                        current_tool_call_id,
+                                    )
+                                ]
+                            )
+                            yield await function_schema.aparse_args(
+                                async_iter([args_json])
                             )
-                        )
-                        yield output
-                        if not tool_call_ref and not self._exhausted:
-                            # Finish the group to allow advancing to the next one
-                            # Output must be AsyncIterable if aparse_args above did not consume
-                            assert isinstance(output, AsyncIterable), output
-                            # Consume stream via the output type so it can cache
-                            await aconsume(output)
                     except ValidationError as e:
-                        assert current_tool_call_id is not None
                         raise ToolSchemaParseError(
                             output_message=self._state.current_message_snapshot,
                             tool_call_id=current_tool_call_id,
                             validation_error=e,
                         ) from e
+                    current_tool_call_chunk = await anext(tool_calls_stream, None)
             elif new_current_item := await anext(stream, None):
                 current_item_ref.append(new_current_item)
-
-    @property
-    def usage_ref(self) -> list[Usage]:
-        return self._state.usage_ref
@@ -1,10 +1,18 @@
 import asyncio
 import collections
+import contextlib
 import textwrap
-from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
 from dataclasses import dataclass
 from itertools import chain, dropwhile
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 T = TypeVar("T")
 
@@ -50,6 +58,44 @@ async def achain(*aiterables: AsyncIterable[T]) -> AsyncIterator[T]:
             yield item
 
 
+async def abuffered(
+    aiterable: AsyncIterable[T], maxsize: int = 0
+) -> AsyncGenerator[T, None]:
+    """Buffer an AsyncIterable by consuming it in a background task.
+
+    This allows the source (e.g. a network stream) to be read concurrently
+    with processing of the items already received. `maxsize` bounds the
+    number of buffered items, with 0 meaning unbounded.
+    """
+    queue: asyncio.Queue[T | object] = asyncio.Queue(maxsize=maxsize)
+    sentinel = object()
+
+    async def fill() -> None:
+        try:
+            async for item in aiterable:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            # Cancellation means the consumer stopped reading, so it will
+            # never drain the queue and a blocking put could hang this task
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(sentinel)
+            raise
+        except BaseException:
+            # Deliver the sentinel so the consumer wakes and re-raises below
+            await queue.put(sentinel)
+            raise
+        await queue.put(sentinel)
+
+    task = asyncio.create_task(fill())
+    try:
+        while (item := await queue.get()) is not sentinel:
+            yield cast("T", item)
+        # Raise any exception raised while consuming the source
+        await task
+    finally:
+        task.cancel()
+
+
 def peek(iterator: Iterator[T]) -> tuple[T, Iterator[T]]:
     """Returns the first item in the Iterator and a copy of the Iterator."""
     first_item = next(iterator)
@@ -209,6 +255,68 @@ async def aiter_streamed_json_array(chunks: AsyncIterable[str]) -> AsyncIterable
             item_chars.append(char)
 
 
+class PushbackIterator(Iterator[T]):
+    """Wraps an Iterator and allows items to be pushed back onto it.
+
+    This avoids repeatedly rewrapping the iterator with `itertools.chain`
+    when peeking at items, which would add a layer of indirection per wrap.
+
+    If `func` is provided it is applied to each new item from the wrapped
+    iterator, like `apply`, but without adding a generator layer. Pushed
+    back items are not passed to `func` again when they are re-returned.
+    """
+
+    def __init__(self, iterator: Iterator[T], func: Callable[[T], Any] | None = None):
+        self._iterator = iterator
+        self._func = func
+        self._pushed: collections.deque[T] = collections.deque()
+
+    def __next__(self) -> T:
+        if self._pushed:
+            return self._pushed.pop()
+        item = next(self._iterator)
+        if self._func:
+            self._func(item)
+        return item
+
+    def push(self, item: T) -> None:
+        """Push an item back so that it is returned by the next call to `next`."""
+        self._pushed.append(item)
+
+    @property
+    def has_pushed(self) -> bool:
+        """Whether there are pushed back items that have not yet been returned."""
+        return bool(self._pushed)
+
+
+class AsyncPushbackIterator(AsyncIterator[T]):
+    """Async version of `PushbackIterator`."""
+
+    def __init__(
+        self, aiterator: AsyncIterator[T], func: Callable[[T], Any] | None = None
+    ):
+        self._aiterator = aiterator
+        self._func = func
+        self._pushed: collections.deque[T] = collections.deque()
+
+    async def __anext__(self) -> T:
+        if self._pushed:
+            return self._pushed.pop()
+        item = await anext(self._aiterator)
+        if self._func:
+            self._func(item)
+        return item
+
+    def push(self, item: T) -> None:
+        """Push an item back so that it is returned by the next call to `anext`."""
+        self._pushed.append(item)
+
+    @property
+    def has_pushed(self) -> bool:
+        """Whether there are pushed back items that have not yet been returned."""
+        return bool(self._pushed)
+
+
 class CachedIterable(Iterable[T]):
     """Wraps an Iterable and caches the items after the first iteration."""
 
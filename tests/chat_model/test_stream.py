@@ -0,0 +1,139 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from magentic.chat_model.function_schema import FunctionCallFunctionSchema
+from magentic.chat_model.message import AssistantMessage, Message, Usage
+from magentic.chat_model.stream import (
+    AsyncOutputStream,
+    FunctionCallChunk,
+    OutputStream,
+    StreamParser,
+    StreamState,
+)
+from magentic.function_call import FunctionCall
+from magentic.streaming import AsyncStreamedStr, StreamedStr, async_iter
+
+
+@dataclass(frozen=True)
+class FakeItem:
+    content: str | None = None
+    tool_call: FunctionCallChunk | None = None
+
+
+class FakeStreamParser(StreamParser[FakeItem]):
+    __slots__ = ()
+
+    def is_content(self, item: FakeItem) -> bool:
+        return item.content is not None
+
+    def get_content(self, item: FakeItem) -> str | None:
+        return item.content
+
+    def is_tool_call(self, item: FakeItem) -> bool:
+        return item.tool_call is not None
+
+    def iter_tool_calls(self, item: FakeItem) -> Iterable[FunctionCallChunk]:
+        return [item.tool_call] if item.tool_call else []
+
+
+class FakeStreamState(StreamState[FakeItem]):
+    def __init__(self) -> None:
+        self.usage_ref: list[Usage] = []
+
+    def update(self, item: FakeItem) -> None:
+        pass
+
+    @property
+    def current_message_snapshot(self) -> Message[str]:
+        return AssistantMessage("")
+
+
+def plus(a: int, b: int) -> int:
+    return a + b
+
+
+def test_output_stream_batch_chars_coalesces():
+    items = [FakeItem(content=content) for content in ["ab", "cd", "ef", "g"]]
+    stream: OutputStream[FakeItem, Any] = OutputStream(
+        iter(items), [], FakeStreamParser(), FakeStreamState(), batch_chars=4
+    )
+    (streamed_str,) = list(stream)
+    assert isinstance(streamed_str, StreamedStr)
+    # "abcd" reaches the size threshold, "efg" is the final flush
+    assert list(streamed_str) == ["abcd", "efg"]
+
+
+def test_output_stream_batch_chars_flushes_on_tool_call():
+    items = [
+        FakeItem(content="ab"),
+        FakeItem(content="c"),
+        FakeItem(
+            tool_call=FunctionCallChunk(id="1", name="plus", args='{"a": 1, "b": 2}')
+        ),
+    ]
+    stream = OutputStream(
+        iter(items),
+        [FunctionCallFunctionSchema(plus)],
+        FakeStreamParser(),
+        FakeStreamState(),
+        batch_chars=10,
+    )
+    streamed_str, function_call = list(stream)
+    assert isinstance(streamed_str, StreamedStr)
+    # The buffer is flushed at the tool call boundary despite being under size
+    assert list(streamed_str) == ["abc"]
+    assert function_call == FunctionCall(plus, 1, 2)
+
+
+def test_output_stream_batch_chars_no_empty_yields():
+    items = [FakeItem(content="a"), FakeItem(content=None), FakeItem(content="b")]
+    stream: OutputStream[FakeItem, Any] = OutputStream(
+        iter(items), [], FakeStreamParser(), FakeStreamState(), batch_chars=0
+    )
+    (streamed_str,) = list(stream)
+    # Content-less chunks must not flush an empty string
+    assert list(streamed_str) == ["a", "b"]
+
+
+async def test_async_output_stream_batch_chars_coalesces():
+    items = [FakeItem(content=content) for content in ["ab", "cd", "ef", "g"]]
+    stream: AsyncOutputStream[FakeItem, Any] = AsyncOutputStream(
+        async_iter(items), [], FakeStreamParser(), FakeStreamState(), batch_chars=4
+    )
+    (streamed_str,) = [output async for output in stream]
+    assert isinstance(streamed_str, AsyncStreamedStr)
+    # "abcd" reaches the size threshold, "efg" is the final flush
+    assert [chunk async for chunk in streamed_str] == ["abcd", "efg"]
+
+
+async def test_async_output_stream_batch_chars_flushes_on_tool_call():
+    items = [
+        FakeItem(content="ab"),
+        FakeItem(content="c"),
+        FakeItem(
+            tool_call=FunctionCallChunk(id="1", name="plus", args='{"a": 1, "b": 2}')
+        ),
+    ]
+    stream = AsyncOutputStream(
+        async_iter(items),
+        [FunctionCallFunctionSchema(plus)],
+        FakeStreamParser(),
+        FakeStreamState(),
+        batch_chars=10,
+    )
+    streamed_str, function_call = [output async for output in stream]
+    assert isinstance(streamed_str, AsyncStreamedStr)
+    # The buffer is flushed at the tool call boundary despite being under size
+    assert [chunk async for chunk in streamed_str] == ["abc"]
+    assert function_call == FunctionCall(plus, 1, 2)
+
+
+async def test_async_output_stream_batch_chars_no_empty_yields():
+    items = [FakeItem(content="a"), FakeItem(content=None), FakeItem(content="b")]
+    stream: AsyncOutputStream[FakeItem, Any] = AsyncOutputStream(
+        async_iter(items), [], FakeStreamParser(), FakeStreamState(), batch_chars=0
+    )
+    (streamed_str,) = [output async for output in stream]
+    # Content-less chunks must not flush an empty string
+    assert [chunk async for chunk in streamed_str] == ["a", "b"]
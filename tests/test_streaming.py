@@ -1,12 +1,16 @@
+import asyncio
 from collections.abc import AsyncIterator
 
 import pytest
 
 from magentic import AsyncStreamedStr, StreamedStr
 from magentic.streaming import (
+    AsyncPushbackIterator,
     CachedAsyncIterable,
     CachedIterable,
+    PushbackIterator,
     aapply,
+    abuffered,
     adropwhile,
     agroupby,
     aiter_streamed_json_array,
@@ -51,6 +55,34 @@ async def test_azip(aiterable, expected):
     assert [x async for x in aiterable] == expected
 
 
+async def test_abuffered():
+    aiterable = abuffered(async_iter([1, 2, 3]), maxsize=2)
+    assert [x async for x in aiterable] == [1, 2, 3]
+
+
+async def test_abuffered_raises():
+    async def araise() -> AsyncIterator[int]:
+        yield 1
+        msg = "raised in source"
+        raise ValueError(msg)
+
+    aiterable = abuffered(araise(), maxsize=2)
+    with pytest.raises(ValueError, match="raised in source"):
+        _ = [x async for x in aiterable]
+
+
+async def test_abuffered_aclose_with_full_buffer():
+    aiterable = abuffered(async_iter(range(10)), maxsize=1)
+    assert await anext(aiterable) == 0
+    (fill_task,) = asyncio.all_tasks() - {asyncio.current_task()}
+    # Let the fill task refill the queue and block on the full queue
+    await asyncio.sleep(0)
+    await aiterable.aclose()
+    # The cancelled fill task must finish even though the queue is still full
+    _done, pending = await asyncio.wait({fill_task}, timeout=1)
+    assert not pending
+
+
 @pytest.mark.parametrize(
     ("iterator", "expected_first", "expected_remaining"),
     [
@@ -141,6 +173,46 @@ async def test_aiter_streamed_json_array(input, expected):
     assert [x async for x in aiter_streamed_json_array(async_iter(input))] == expected
 
 
+def test_pushback_iterator():
+    iterator = PushbackIterator(iter([1, 2, 3]))
+    assert next(iterator) == 1
+    assert not iterator.has_pushed
+    iterator.push(1)
+    assert iterator.has_pushed
+    assert list(iterator) == [1, 2, 3]
+    assert not iterator.has_pushed
+
+
+def test_pushback_iterator_func():
+    items: list[int] = []
+    iterator = PushbackIterator(iter([1, 2, 3]), items.append)
+    assert next(iterator) == 1
+    iterator.push(1)
+    assert list(iterator) == [1, 2, 3]
+    # Pushed back items are not passed to func again
+    assert items == [1, 2, 3]
+
+
+async def test_async_pushback_iterator():
+    aiterator = AsyncPushbackIterator(async_iter([1, 2, 3]))
+    assert await anext(aiterator) == 1
+    assert not aiterator.has_pushed
+    aiterator.push(1)
+    assert aiterator.has_pushed
+    assert [x async for x in aiterator] == [1, 2, 3]
+    assert not aiterator.has_pushed
+
+
+async def test_async_pushback_iterator_func():
+    items: list[int] = []
+    aiterator = AsyncPushbackIterator(async_iter([1, 2, 3]), items.append)
+    assert await anext(aiterator) == 1
+    aiterator.push(1)
+    assert [x async for x in aiterator] == [1, 2, 3]
+    # Pushed back items are not passed to func again
+    assert items == [1, 2, 3]
+
+
 @pytest.mark.parametrize(
     ("input", "expected"),
     [